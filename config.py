@@ -1,6 +1,7 @@
 """Application-wide configuration helpers for Kalshi API access."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -8,6 +9,11 @@ from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache(maxsize=8)
+def _read_pem(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
 class KalshiSettings(BaseSettings):
     """Load configuration from environment variables or a .env file."""
 
@@ -90,11 +96,11 @@ class KalshiSettings(BaseSettings):
         return path.expanduser().resolve()
 
     def read_private_key(self) -> Optional[str]:
-        """Return the PEM key content if a path was provided."""
+        """Return the PEM key content if a path was provided (read once per path)."""
         if self.private_key_path is None:
             return None
         try:
-            return self.private_key_path.read_text(encoding="utf-8")
+            return _read_pem(self.private_key_path)
         except FileNotFoundError as exc:
             raise FileNotFoundError(
                 f"Private key file not found at {self.private_key_path}"
@@ -114,9 +120,17 @@ class KalshiSettings(BaseSettings):
             parts.append(f"PWD={self.sqlserver_password}")
         parts.append("TrustServerCertificate=yes")
         parts.append("Connection Timeout=15")
+        # fast_executemany into the #staging tables needs SQLDescribeParam, which
+        # the driver can only answer for temp tables via SET FMTONLY.
+        parts.append("UseFMTONLY=Yes")
         return ";".join(parts)
 
     @property
     def sqlserver_connection_string(self) -> str:
         return self.build_sqlserver_connection_string()
 
+
+@lru_cache(maxsize=1)
+def get_settings() -> KalshiSettings:
+    """Return the process-wide settings, validated once on first use."""
+    return KalshiSettings()
@@ -5,19 +5,27 @@ import base64
 import logging
 import time
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Callable, Optional
 from urllib.parse import urlparse
 
 import kalshi_python
+import orjson
 import requests
+from cryptography.exceptions import UnsupportedAlgorithm
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 from kalshi_python.rest import ApiException
 from requests import RequestException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from config import KalshiSettings
 
+_SHA256 = hashes.SHA256()
+_PSS_PAD = padding.PSS(mgf=padding.MGF1(_SHA256), salt_length=padding.PSS.DIGEST_LENGTH)
+
 
 class AuthenticationConfigError(RuntimeError):
     """Raised when an authenticated call is attempted without proper credentials."""
@@ -27,7 +35,20 @@ class KalshiAPIError(RuntimeError):
     """Raised when the Kalshi API responds with an error."""
 
 
-@dataclass(frozen=True)
+def json_fast(response: Any) -> Any:
+    """Decode a JSON response body with orjson, straight from its bytes.
+
+    Accepts a ``requests.Response`` or the SDK's raw (``*_without_preload_content``)
+    urllib3 response.
+    """
+    if isinstance(response, requests.Response):
+        body = response.content
+    else:
+        body = getattr(response, "data", None)
+    return orjson.loads(body or b"")
+
+
+@dataclass(frozen=True, slots=True)
 class CallMetadata:
     """Details captured for each API invocation."""
 
@@ -43,22 +64,28 @@ class KalshiAPIClient:
         self.settings = settings
         self.logger = logger or logging.getLogger("kalshi")
         self._configuration = kalshi_python.Configuration(host=settings.host)
-        self._auth_enabled = False
-        private_key = self.settings.read_private_key()
+        # The key is only read and parsed on the first authenticated request.
+        self._auth_enabled = bool(settings.api_key_id and settings.private_key_path)
         parsed_host = urlparse(settings.host)
+        self._base_url = settings.host.rstrip("/")
         self._base_path = (parsed_host.path or "").rstrip("/")
-        self._private_key = None
-        if self.settings.api_key_id and private_key:
-            self._configuration.api_key_id = self.settings.api_key_id
-            self._configuration.private_key_pem = private_key
-            self._auth_enabled = True
-            key_bytes = private_key.encode("utf-8") if isinstance(private_key, str) else private_key
-            self._private_key = serialization.load_pem_private_key(
-                key_bytes,
-                password=None,
-                backend=default_backend(),
-            )
         self._client = kalshi_python.KalshiClient(self._configuration)
+        self._sdk_auth_attached = False
+        self._op_cache: dict[str, Callable[..., Any]] = {}
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=(502, 503, 504),
+                    raise_on_status=False,
+                ),
+            ),
+        )
 
     def call(self, operation: str, *, authenticated: bool = False, **kwargs: Any) -> Any:
         """Dispatch an API call with consistent logging and exception mapping."""
@@ -67,13 +94,25 @@ class KalshiAPIClient:
             raise AuthenticationConfigError(
                 "Authenticated call requested but API credentials are missing"
             )
+        if authenticated and not self._sdk_auth_attached:
+            # Parse the key before handing it over so a malformed PEM fails here
+            # as a config error instead of as a ValueError inside the SDK.
+            _ = self._private_key_obj
+            self._client.api_key_id = self.settings.api_key_id
+            self._client.private_key_pem = self._private_key_pem
+            self._sdk_auth_attached = True
         return self._execute(endpoint, operation, authenticated, kwargs)
 
     def _resolve_operation(self, operation: str) -> Callable[..., Any]:
+        cached = self._op_cache.get(operation)
+        if cached is not None:
+            return cached
         try:
-            return getattr(self._client, operation)
+            endpoint = getattr(self._client, operation)
         except AttributeError as exc:
             raise AttributeError(f"Kalshi client has no operation '{operation}'") from exc
+        self._op_cache[operation] = endpoint
+        return endpoint
 
     def _execute(
         self,
@@ -82,15 +121,17 @@ class KalshiAPIClient:
         authenticated: bool,
         params: dict[str, Any],
     ) -> Any:
-        start = time.perf_counter()
-        self.logger.debug(
-            "Kalshi request started",
-            extra={
-                "operation": operation,
-                "authenticated": authenticated,
-                "params": params,
-            },
-        )
+        # Timing only feeds the INFO completion record, so skip it otherwise.
+        start = time.perf_counter() if self.logger.isEnabledFor(logging.INFO) else None
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Kalshi request started",
+                extra={
+                    "operation": operation,
+                    "authenticated": authenticated,
+                    "params": params,
+                },
+            )
         try:
             response = endpoint(**params)
         except ApiException as api_exc:
@@ -101,36 +142,63 @@ class KalshiAPIClient:
         except Exception as exc:  # pragma: no cover - safeguard
             self._log_failure(operation, authenticated, start, exc)
             raise
-        duration_ms = (time.perf_counter() - start) * 1000
-        metadata = CallMetadata(operation, authenticated, duration_ms)
-        self.logger.info(
-            "Kalshi request completed",
-            extra={
-                "operation": metadata.operation,
-                "authenticated": metadata.authenticated,
-                "duration_ms": round(metadata.duration_ms, 2),
-            },
-        )
+        if start is not None:
+            duration_ms = (time.perf_counter() - start) * 1000
+            metadata = CallMetadata(operation, authenticated, duration_ms)
+            self.logger.info(
+                "Kalshi request completed",
+                extra={
+                    "operation": metadata.operation,
+                    "authenticated": metadata.authenticated,
+                    "duration_ms": round(metadata.duration_ms, 2),
+                },
+            )
         return response
 
     def _log_failure(
         self,
         operation: str,
         authenticated: bool,
-        start: float,
+        start: Optional[float],
         error: Exception,
     ) -> None:
-        duration_ms = (time.perf_counter() - start) * 1000
+        duration_ms = None
+        if start is not None:
+            duration_ms = round((time.perf_counter() - start) * 1000, 2)
         self.logger.error(
-            f"Kalshi request failed：{str(error)}",
+            "Kalshi request failed: %s",
+            error,
             extra={
                 "operation": operation,
                 "authenticated": authenticated,
-                "duration_ms": round(duration_ms, 2),
+                "duration_ms": duration_ms,
                 "error": str(error),
             },
         )
 
+    @cached_property
+    def _private_key_pem(self) -> str:
+        try:
+            private_key = self.settings.read_private_key()
+        except FileNotFoundError as exc:
+            raise AuthenticationConfigError(str(exc)) from exc
+        if not private_key:
+            raise AuthenticationConfigError("Kalshi private key is empty or missing")
+        return private_key
+
+    @cached_property
+    def _private_key_obj(self) -> Any:
+        try:
+            return serialization.load_pem_private_key(
+                self._private_key_pem.encode("utf-8"),
+                password=None,
+                backend=default_backend(),
+            )
+        except (TypeError, ValueError, UnsupportedAlgorithm) as exc:
+            raise AuthenticationConfigError(
+                f"Kalshi private key is not a usable PEM key: {exc}"
+            ) from exc
+
     @property
     def auth_enabled(self) -> bool:
         return self._auth_enabled
@@ -153,7 +221,7 @@ class KalshiAPIClient:
         timeout: float = 30.0,
     ) -> requests.Response:
         """Perform a raw HTTP request with Kalshi authentication headers."""
-        prepared_url = self._prepare_url(url)
+        prepared_url, signing_path = self._prepare_url(url)
         method_upper = method.upper()
         request_headers: dict[str, str] = dict(headers or {})
         if authenticated:
@@ -161,19 +229,25 @@ class KalshiAPIClient:
                 raise AuthenticationConfigError(
                     "Authenticated call requested but API credentials are missing"
                 )
-            request_headers.update(self._build_auth_headers(method_upper, prepared_url))
-        start = time.perf_counter()
+            request_headers.update(self._build_auth_headers(method_upper, signing_path))
+        if json is not None:
+            data = orjson.dumps(json, option=orjson.OPT_NON_STR_KEYS)
+            json = None
+            if not any(key.lower() == "content-type" for key in request_headers):
+                request_headers["Content-Type"] = "application/json"
+        start = time.perf_counter() if self.logger.isEnabledFor(logging.INFO) else None
         operation = f"{method_upper} {prepared_url}"
-        self.logger.debug(
-            "Kalshi HTTP request started",
-            extra={
-                "operation": operation,
-                "authenticated": authenticated,
-                "params": params,
-            },
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Kalshi HTTP request started",
+                extra={
+                    "operation": operation,
+                    "authenticated": authenticated,
+                    "params": params,
+                },
+            )
         try:
-            response = requests.request(
+            response = self._session.request(
                 method_upper,
                 prepared_url,
                 params=params,
@@ -188,39 +262,40 @@ class KalshiAPIClient:
             raise KalshiAPIError(
                 f"Kalshi HTTP error during '{operation}': {exc}"
             ) from exc
-        duration_ms = (time.perf_counter() - start) * 1000
-        self.logger.info(
-            "Kalshi HTTP request completed",
-            extra={
-                "operation": operation,
-                "authenticated": authenticated,
-                "duration_ms": round(duration_ms, 2),
-                "status_code": response.status_code,
-            },
-        )
+        if start is not None:
+            duration_ms = (time.perf_counter() - start) * 1000
+            self.logger.info(
+                "Kalshi HTTP request completed",
+                extra={
+                    "operation": operation,
+                    "authenticated": authenticated,
+                    "duration_ms": round(duration_ms, 2),
+                    "status_code": response.status_code,
+                },
+            )
         return response
 
-    def _prepare_url(self, url: str) -> str:
+    def close(self) -> None:
+        """Release pooled HTTP connections held by the client."""
+        self._session.close()
+
+    def _prepare_url(self, url: str) -> tuple[str, str]:
+        """Return the absolute request URL and the path that gets signed."""
         if url.lower().startswith(("http://", "https://")):
-            return url
-        base = self.settings.host.rstrip("/")
+            return url, urlparse(url).path
         path = url.lstrip("/")
-        return f"{base}/{path}"
+        signing_path = f"{self._base_path}/{path.split('?', 1)[0]}"
+        return f"{self._base_url}/{path}", signing_path
 
-    def _build_auth_headers(self, method: str, url: str) -> dict[str, str]:
-        if not self.settings.api_key_id or not self._private_key:
+    def _build_auth_headers(self, method: str, path: str) -> dict[str, str]:
+        if not self._auth_enabled:
             raise AuthenticationConfigError("Kalshi credentials are not configured")
-        timestamp_str = str(int(time.time() * 1000))
-        parsed = urlparse(url)
-        path_no_query = parsed.path.split("?")[0]
-        message = f"{timestamp_str}{method}{path_no_query}"
-        signature = self._private_key.sign(
+        timestamp_str = str(time.time_ns() // 1_000_000)
+        message = f"{timestamp_str}{method}{path}"
+        signature = self._private_key_obj.sign(
             message.encode("utf-8"),
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.DIGEST_LENGTH,
-            ),
-            hashes.SHA256(),
+            _PSS_PAD,
+            _SHA256,
         )
         signature_b64 = base64.b64encode(signature).decode("utf-8")
         return {
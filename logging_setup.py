@@ -5,13 +5,27 @@ import logging
 from pathlib import Path
 from logging.config import dictConfig
 
+_CONFIGURED = False
+
 
 def configure_logging(
     level: str = "INFO",
     log_dir: Path | str | None = None,
     filename: str = "kalshi.log",
 ) -> logging.Logger:
-    """Configure application logging (console + daily file rotation)."""
+    """Configure application logging (console + daily file rotation).
+
+    Handlers are installed on the first call only; later calls just apply
+    the requested level so repeated calls do not rebuild the handler tree.
+    """
+    global _CONFIGURED
+    if _CONFIGURED:
+        root = logging.getLogger()
+        root.setLevel(level.upper())
+        for handler in root.handlers:
+            handler.setLevel(level.upper())
+        return logging.getLogger("kalshi")
+
     log_directory = Path(log_dir or "logs").expanduser().resolve()
     log_directory.mkdir(parents=True, exist_ok=True)
     log_file = log_directory / filename
@@ -48,5 +62,6 @@ def configure_logging(
             },
         }
     )
+    _CONFIGURED = True
     return logging.getLogger("kalshi")
 
@@ -2,18 +2,36 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Any, List, Optional
+from operator import attrgetter
+from typing import Any, Callable, List, Optional, Sequence
 
 
-def _get_value(source: Any, attribute: str) -> Any:
-    if isinstance(source, Mapping):
-        return source.get(attribute)
-    return getattr(source, attribute, None)
+def _values_from_mapping(item: Mapping[str, Any]) -> tuple[Any, ...]:
+    get = item.get
+    return (
+        str(get("event_ticker") or ""),
+        get("series_ticker"),
+        get("sub_title"),
+        get("title"),
+        get("status"),
+        get("markets"),
+    )
 
 
-@dataclass(frozen=True)
+def _values_from_object(item: Any) -> tuple[Any, ...]:
+    return (
+        str(getattr(item, "event_ticker", None) or ""),
+        getattr(item, "series_ticker", None),
+        getattr(item, "sub_title", None),
+        getattr(item, "title", None),
+        getattr(item, "status", None),
+        getattr(item, "markets", None),
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class EventRecord:
     event_ticker: str
     series_ticker: Optional[str]
@@ -26,17 +44,68 @@ class EventRecord:
 
     @classmethod
     def from_api(cls, item: Any) -> "EventRecord":
-        return cls(
-            event_ticker=str(_get_value(item, "event_ticker") or ""),
-            series_ticker=_get_value(item, "series_ticker"),
-            sub_title=_get_value(item, "sub_title"),
-            title=_get_value(item, "title"),
-            status=_get_value(item, "status"),
-            markets=_get_value(item, "markets"),
+        extract = _values_from_mapping if isinstance(item, dict) else _values_from_object
+        return cls(*extract(item))
+
+    @classmethod
+    def from_api_batch(cls, items: Sequence[Any]) -> list["EventRecord"]:
+        """Build records for a page of API items that all share one type."""
+        if not items:
+            return []
+        extract: Callable[[Any], tuple[Any, ...]] = (
+            _values_from_mapping if isinstance(items[0], dict) else _values_from_object
         )
+        # Write the slots directly instead of going through the frozen __init__.
+        (
+            set_event_ticker,
+            set_series_ticker,
+            set_sub_title,
+            set_title,
+            set_status,
+            set_markets,
+            set_add_time,
+            set_update_time,
+        ) = _SLOT_SETTERS
+        new = cls.__new__
+        records = []
+        append = records.append
+        for item in items:
+            event_ticker, series_ticker, sub_title, title, status, markets = extract(item)
+            record = new(cls)
+            set_event_ticker(record, event_ticker)
+            set_series_ticker(record, series_ticker)
+            set_sub_title(record, sub_title)
+            set_title(record, title)
+            set_status(record, status)
+            set_markets(record, markets)
+            set_add_time(record, None)
+            set_update_time(record, None)
+            append(record)
+        return records
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "event_ticker": self.event_ticker,
+            "series_ticker": self.series_ticker,
+            "sub_title": self.sub_title,
+            "title": self.title,
+            "status": self.status,
+            "markets": self.markets,
+            "add_time": self.add_time,
+            "update_time": self.update_time,
+        }
+
+    def to_sql_params(self, now: Optional[datetime] = None) -> tuple[Any, ...]:
+        """Return values in the upsert column order, defaulting timestamps to ``now``."""
+        return (*_SQL_VALUES(self), self.add_time or now, self.update_time or now)
+
+
+# Upsert column order shared with EventRepository; the first column is the key.
+SQL_COLUMNS = ("event_ticker", "series_ticker", "title", "sub_title", "add_time", "update_time")
+_SQL_VALUES = attrgetter(*SQL_COLUMNS[:-2])
+_SLOT_SETTERS = tuple(
+    EventRecord.__dict__[field.name].__set__ for field in fields(EventRecord)
+)
 
 
-__all__ = ["EventRecord"]
+__all__ = ["EventRecord", "SQL_COLUMNS"]
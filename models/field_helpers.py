@@ -0,0 +1,16 @@
+"""Value helpers shared by the record models."""
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+
+def intern_str(value: Any) -> Any:
+    """Share one string object for low-cardinality fields across a crawl.
+
+    Non-string values are returned unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+__all__ = ["intern_str"]
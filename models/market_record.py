@@ -1,10 +1,16 @@
 """Normalized representation of Kalshi markets for persistence."""
 from __future__ import annotations
 
+import re
 from collections.abc import Mapping
-from dataclasses import asdict, dataclass
-from datetime import datetime
-from typing import Any, Optional
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Any, Callable, Optional
+
+from ciso8601 import parse_datetime as _parse_iso
+
+from models.field_helpers import intern_str as _intern
 
 
 def _as_float(value: Any) -> Optional[float]:
@@ -26,26 +32,150 @@ def _as_int(value: Any) -> Optional[int]:
 
 
 def _parse_datetime(value: Any) -> Optional[datetime]:
-    if value is None:
-        return None
-    if isinstance(value, datetime):
-        return value
+    """Parse a timestamp to an aware UTC datetime; naive values are taken as UTC."""
     if isinstance(value, str):
-        normalized = value[:-1] + "+00:00" if value.endswith("Z") else value
         try:
-            return datetime.fromisoformat(normalized)
+            value = _parse_iso(value)
         except ValueError:
             return None
-    return None
+    elif not isinstance(value, datetime):
+        return None
+    tzinfo = value.tzinfo
+    if tzinfo is timezone.utc:
+        return value
+    if tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    # pyodbc drops tzinfo, so every save path must bind the same UTC wall time.
+    return value.astimezone(timezone.utc)
+
+
+def _parse_epoch(value: Any) -> Optional[float]:
+    """Parse a timestamp to epoch seconds; naive values are taken as UTC.
+
+    Floats hold microsecond precision for realistic dates (up to about 2240);
+    timestamps further out can be off by a few microseconds.
+    """
+    parsed = _parse_datetime(value)
+    if parsed is None:
+        return None
+    return parsed.timestamp()
+
+
+def _from_epoch(value: Optional[float]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc)
 
 
-def _get_value(source: Any, attribute: str) -> Any:
-    if isinstance(source, Mapping):
-        return source.get(attribute)
-    return getattr(source, attribute, None)
+# Constructor arguments in field order. ``$name`` marks a lookup on the API
+# item and is expanded per source type by _compile_builder().
+_FIELD_EXPRESSIONS = (
+    ("ticker", 'str($ticker or "")'),
+    ("series_ticker", "_intern($series_ticker)"),
+    ("event_ticker", "_intern($event_ticker)"),
+    ("title", "$title"),
+    ("sub_title", "$subtitle or $sub_title"),
+    ("status", "_intern($status)"),
+    ("open_time", "_parse_epoch($open_time)"),
+    ("close_time", "_parse_epoch($close_time)"),
+    ("expiration_time", "_parse_epoch($expiration_time)"),
+    ("yes_bid", "_as_float($yes_bid)"),
+    ("yes_ask", "_as_float($yes_ask)"),
+    ("no_bid", "_as_float($no_bid)"),
+    ("no_ask", "_as_float($no_ask)"),
+    ("last_price", "_as_float($last_price)"),
+    ("volume", "_as_int($volume)"),
+    ("volume_24h", "_as_int($volume_24h)"),
+    ("result", "_intern($result)"),
+    ("can_close_early", "$can_close_early"),
+    ("cap_count", "_as_int($cap_count)"),
+)
+# Upsert column order shared with MarketRepository; the first column is the key.
+SQL_COLUMNS = (
+    "ticker",
+    "event_ticker",
+    "series_ticker",
+    "title",
+    "sub_title",
+    "status",
+    "open_time",
+    "close_time",
+    "expiration_time",
+    "yes_bid",
+    "yes_ask",
+    "no_bid",
+    "no_ask",
+    "last_price",
+    "volume",
+    "volume_24h",
+    "result",
+    "can_close_early",
+    "cap_count",
+    "add_time",
+    "update_time",
+)
+# Upsert parameters straight from the API item, stamped with the batch time.
+# Timestamps stay datetimes here; only records carry the epoch form.
+_SQL_FIELD_EXPRESSIONS = tuple(
+    dict(
+        _FIELD_EXPRESSIONS,
+        open_time="_parse_datetime($open_time)",
+        close_time="_parse_datetime($close_time)",
+        expiration_time="_parse_datetime($expiration_time)",
+        add_time="now",
+        update_time="now",
+    )[name]
+    for name in SQL_COLUMNS
+)
+_LOOKUP_PATTERN = re.compile(r"\$(\w+)")
 
 
-@dataclass(frozen=True)
+def _compile_builder(
+    name: str,
+    lookup: str,
+    expressions: tuple[str, ...],
+    params: str = "item",
+) -> Callable[..., tuple[Any, ...]]:
+    """Generate a function returning the value tuple with every lookup inlined."""
+    arguments = ",\n        ".join(
+        _LOOKUP_PATTERN.sub(lambda match: lookup.format(match.group(1)), expression)
+        for expression in expressions
+    )
+    source = (
+        f"def {name}({params}, _as_float=_as_float, _as_int=_as_int, "
+        f"_intern=_intern, _parse_datetime=_parse_datetime, _parse_epoch=_parse_epoch):\n"
+        f"    return (\n        {arguments},\n    )\n"
+    )
+    namespace: dict[str, Any] = {
+        "_as_float": _as_float,
+        "_as_int": _as_int,
+        "_intern": _intern,
+        "_parse_datetime": _parse_datetime,
+        "_parse_epoch": _parse_epoch,
+    }
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_MAPPING_LOOKUP = 'item.get("{}")'
+_OBJECT_LOOKUP = 'getattr(item, "{}", None)'
+_RECORD_EXPRESSIONS = tuple(expression for _, expression in _FIELD_EXPRESSIONS)
+
+_BUILD_FROM_MAPPING = _compile_builder("_build_from_mapping", _MAPPING_LOOKUP, _RECORD_EXPRESSIONS)
+_BUILD_FROM_OBJ = _compile_builder("_build_from_obj", _OBJECT_LOOKUP, _RECORD_EXPRESSIONS)
+_ROW_FROM_MAPPING = _compile_builder(
+    "_row_from_mapping", _MAPPING_LOOKUP, _SQL_FIELD_EXPRESSIONS, params="item, now"
+)
+_ROW_FROM_OBJ = _compile_builder(
+    "_row_from_obj", _OBJECT_LOOKUP, _SQL_FIELD_EXPRESSIONS, params="item, now"
+)
+# MarketRecord.to_sql_params() reads the columns on either side of the three
+# epoch time columns (SQL_COLUMNS[6:9]), which it converts back to datetimes.
+_SQL_HEAD_VALUES = attrgetter(*SQL_COLUMNS[:6])
+_SQL_TAIL_VALUES = attrgetter(*SQL_COLUMNS[9:-2])
+
+
+@dataclass(frozen=True, slots=True)
 class MarketRecord:
     ticker: str
     series_ticker: Optional[str]
@@ -53,9 +183,10 @@ class MarketRecord:
     title: Optional[str]
     sub_title: Optional[str]
     status: Optional[str]
-    open_time: Optional[datetime]
-    close_time: Optional[datetime]
-    expiration_time: Optional[datetime]
+    # Epoch seconds (UTC, sub-second precision kept); see the *_dt properties.
+    open_time: Optional[float]
+    close_time: Optional[float]
+    expiration_time: Optional[float]
     yes_bid: Optional[float]
     yes_ask: Optional[float]
     no_bid: Optional[float]
@@ -71,30 +202,67 @@ class MarketRecord:
 
     @classmethod
     def from_api(cls, item: Any) -> "MarketRecord":
-        return cls(
-            ticker=str(_get_value(item, "ticker") or ""),
-            series_ticker=_get_value(item, "series_ticker"),
-            event_ticker=_get_value(item, "event_ticker"),
-            title=_get_value(item, "title"),
-            sub_title=_get_value(item, "subtitle") or _get_value(item, "sub_title"),
-            status=_get_value(item, "status"),
-            open_time=_parse_datetime(_get_value(item, "open_time")),
-            close_time=_parse_datetime(_get_value(item, "close_time")),
-            expiration_time=_parse_datetime(_get_value(item, "expiration_time")),
-            yes_bid=_as_float(_get_value(item, "yes_bid")),
-            yes_ask=_as_float(_get_value(item, "yes_ask")),
-            no_bid=_as_float(_get_value(item, "no_bid")),
-            no_ask=_as_float(_get_value(item, "no_ask")),
-            last_price=_as_float(_get_value(item, "last_price")),
-            volume=_as_int(_get_value(item, "volume")),
-            volume_24h=_as_int(_get_value(item, "volume_24h")),
-            result=_get_value(item, "result"),
-            can_close_early=_get_value(item, "can_close_early"),
-            cap_count=_as_int(_get_value(item, "cap_count")),
-        )
+        build = _BUILD_FROM_MAPPING if isinstance(item, Mapping) else _BUILD_FROM_OBJ
+        return cls(*build(item))
+
+    @classmethod
+    def row_from_api(cls, item: Any, now: Optional[datetime] = None) -> tuple[Any, ...]:
+        """Return upsert parameters for an API item without building a record."""
+        build = _ROW_FROM_MAPPING if isinstance(item, Mapping) else _ROW_FROM_OBJ
+        return build(item, now)
+
+    @property
+    def open_time_dt(self) -> Optional[datetime]:
+        return _from_epoch(self.open_time)
+
+    @property
+    def close_time_dt(self) -> Optional[datetime]:
+        return _from_epoch(self.close_time)
+
+    @property
+    def expiration_time_dt(self) -> Optional[datetime]:
+        return _from_epoch(self.expiration_time)
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return self.to_json_obj()
+
+    def to_json_obj(self) -> dict[str, Any]:
+        """Return a plain dict for logging/serialisation; timestamps are datetimes."""
+        return {
+            "ticker": self.ticker,
+            "series_ticker": self.series_ticker,
+            "event_ticker": self.event_ticker,
+            "title": self.title,
+            "sub_title": self.sub_title,
+            "status": self.status,
+            "open_time": _from_epoch(self.open_time),
+            "close_time": _from_epoch(self.close_time),
+            "expiration_time": _from_epoch(self.expiration_time),
+            "yes_bid": self.yes_bid,
+            "yes_ask": self.yes_ask,
+            "no_bid": self.no_bid,
+            "no_ask": self.no_ask,
+            "last_price": self.last_price,
+            "volume": self.volume,
+            "volume_24h": self.volume_24h,
+            "result": self.result,
+            "can_close_early": self.can_close_early,
+            "cap_count": self.cap_count,
+            "add_time": self.add_time,
+            "update_time": self.update_time,
+        }
+
+    def to_sql_params(self, now: Optional[datetime] = None) -> tuple[Any, ...]:
+        """Return values in the upsert column order, defaulting timestamps to ``now``."""
+        return (
+            *_SQL_HEAD_VALUES(self),
+            _from_epoch(self.open_time),
+            _from_epoch(self.close_time),
+            _from_epoch(self.expiration_time),
+            *_SQL_TAIL_VALUES(self),
+            self.add_time or now,
+            self.update_time or now,
+        )
 
 
-__all__ = ["MarketRecord"]
+__all__ = ["MarketRecord", "SQL_COLUMNS"]
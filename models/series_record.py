@@ -1,14 +1,17 @@
 """Lightweight structures that make Kalshi series data easy to persist."""
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from typing import Any, Optional
 
 from kalshi_python.models.series import Series
 
+from models.field_helpers import intern_str
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SeriesRecord:
     """Normalized view of a Kalshi series suitable for persistence."""
 
@@ -25,24 +28,22 @@ class SeriesRecord:
         return cls(
             ticker=item.ticker,
             title=item.title,
-            category=(item.category or ""),
-            status=item.status,
+            category=intern_str(item.category or ""),
+            status=intern_str(item.status),
         )
 
     def to_dict(self) -> dict[str, Any]:
         """Return a plain dict (e.g., for parameterized SQL inserts)."""
-        return asdict(self)
+        return dict(zip(SQL_COLUMNS, self.to_sql_params()))
 
-    def to_sql_params(self) -> tuple[Any, ...]:
+    def to_sql_params(self, now: Optional[datetime] = None) -> tuple[Any, ...]:
         """Return values in a stable column order for executemany()."""
-        return (
-            self.ticker,
-            self.title,
-            self.category,
-            self.status,
-            self.add_time,
-            self.update_time,
-        )
+        return (*_SQL_VALUES(self), self.add_time or now, self.update_time or now)
+
+
+# Upsert column order shared with SeriesRepository; the first column is the key.
+SQL_COLUMNS = ("ticker", "title", "category", "status", "add_time", "update_time")
+_SQL_VALUES = attrgetter(*SQL_COLUMNS[:-2])
 
 
-__all__ = ["SeriesRecord"]
+__all__ = ["SeriesRecord", "SQL_COLUMNS"]
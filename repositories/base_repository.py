@@ -3,7 +3,10 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Iterator, Optional, Sequence
 
 import pyodbc
 
@@ -14,13 +17,43 @@ class DatabaseSaveError(RuntimeError):
     """Raised when writing to SQL Server fails."""
 
 
+# Row timestamps are named after the model fields; the tables use PascalCase.
+_TARGET_COLUMNS = {"add_time": "AddTime", "update_time": "UpdateTime"}
+
+
 class BaseSQLRepository(ABC):
-    """Provide a consistent way to write batched rows into SQL Server."""
+    """Provide a consistent way to write batched rows into SQL Server.
+
+    Subclasses set ``table_name`` and ``columns``; every upsert statement is
+    derived from those two.
+    """
+
+    batch_size = 1000
+    table_name: str
 
     def __init__(self, settings: KalshiSettings, logger: logging.Logger | None = None) -> None:
         self.settings = settings
         base_logger = logger or logging.getLogger("kalshi")
         self.logger = base_logger.getChild(self.__class__.__name__.lower())
+        self._session_connection: Optional[pyodbc.Connection] = None
+
+    @contextmanager
+    def session(self) -> Iterator[pyodbc.Connection]:
+        """Reuse a single connection for every write made inside the block."""
+        if self._session_connection is not None:
+            yield self._session_connection
+            return
+        try:
+            connection = self._connect()
+        except pyodbc.Error as exc:  # pragma: no cover - depends on driver
+            self.logger.error("Unable to open SQL Server session: %s", exc)
+            raise DatabaseSaveError("Unable to connect to SQL Server") from exc
+        self._session_connection = connection
+        try:
+            yield connection
+        finally:
+            self._session_connection = None
+            connection.close()
 
     def save_many(self, rows: Sequence[tuple[object, ...]]) -> int:
         """Persist rows using the concrete class's insert statement."""
@@ -30,27 +63,189 @@ class BaseSQLRepository(ABC):
         statement = self.insert_statement
         return self._executemany(statement, rows)
 
+    def save_many_parallel(
+        self,
+        rows: Sequence[tuple[object, ...]],
+        workers: int = 4,
+        chunk: int = 2000,
+    ) -> int:
+        """Upsert rows over several connections at once for large backfills.
+
+        Each worker stages its chunks in its own session's temp table and
+        merges them set-based, committing per chunk, so a failure can leave
+        earlier chunks written. The first column of each row is the key.
+        """
+        if workers < 1 or chunk < 1:
+            raise ValueError(f"workers and chunk must be positive, got {workers} and {chunk}")
+        if not rows:
+            self.logger.info("No rows supplied; skipping insert.")
+            return 0
+        # Keep every key in exactly one chunk so workers never touch the same row.
+        unique_rows = list({row[0]: row for row in rows}.values())
+        chunks = [
+            unique_rows[start : start + chunk] for start in range(0, len(unique_rows), chunk)
+        ]
+        groups = [chunks[index::workers] for index in range(min(workers, len(chunks)))]
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            futures = [executor.submit(self._upsert_chunks, group) for group in groups]
+            total = sum(future.result() for future in futures)
+        self.logger.info("Upserted %s rows over %s connections", total, len(groups))
+        return total
+
+    def _upsert_chunks(self, chunks: Sequence[Sequence[tuple[object, ...]]]) -> int:
+        # pyodbc connections must not be shared between threads, and #staging
+        # tables are per session, so every worker opens its own connection.
+        written = 0
+        try:
+            connection = self._connect()
+            try:
+                for rows in chunks:
+                    self._upsert(connection, rows)
+                    written += len(rows)
+            finally:
+                connection.close()
+        except pyodbc.Error as exc:  # pragma: no cover - depends on driver
+            self.logger.error("Parallel bulk upsert failed after %s rows: %s", written, exc)
+            raise DatabaseSaveError("Unable to persist rows to SQL Server") from exc
+        return written
+
+    def bulk_upsert(self, rows: Sequence[tuple[object, ...]]) -> int:
+        """Load rows into a temp staging table and upsert them with one MERGE.
+
+        The first column of each row is treated as the merge key.
+        """
+        if not rows:
+            return 0
+        # MERGE rejects duplicate source keys; keep the last row per key, which
+        # is what a row-by-row upsert would have left behind.
+        unique_rows = list({row[0]: row for row in rows}.values())
+        try:
+            with self._connection() as connection:
+                self._upsert(connection, unique_rows)
+        except pyodbc.Error as exc:  # pragma: no cover - depends on driver
+            self.logger.error("Bulk upsert failed: %s", exc)
+            raise DatabaseSaveError("Unable to persist rows to SQL Server") from exc
+        self.logger.info("Upserted %s rows", len(unique_rows))
+        return len(unique_rows)
+
+    def _upsert(self, connection: pyodbc.Connection, rows: Sequence[tuple[object, ...]]) -> None:
+        """Stage unique-keyed rows on ``connection`` and MERGE them in one commit."""
+        cursor = connection.cursor()
+        cursor.fast_executemany = True
+        try:
+            cursor.execute(self.staging_statement)
+            self._executemany_batches(cursor, self.staging_insert_statement, rows)
+            cursor.execute(self.merge_statement)
+            connection.commit()
+        except pyodbc.Error:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
     def _executemany(self, statement: str, rows: Sequence[tuple[object, ...]]) -> int:
         try:
-            with self._connect() as connection:
+            with self._connection() as connection:
                 cursor = connection.cursor()
                 cursor.fast_executemany = True
-                cursor.executemany(statement, rows)
-                connection.commit()
+                try:
+                    self._executemany_batches(cursor, statement, rows)
+                    connection.commit()
+                except pyodbc.Error:
+                    connection.rollback()
+                    raise
+                finally:
+                    cursor.close()
         except pyodbc.Error as exc:  # pragma: no cover - depends on driver
             self.logger.error("Bulk insert failed: %s", exc)
             raise DatabaseSaveError("Unable to persist rows to SQL Server") from exc
         self.logger.info("Inserted %s rows", len(rows))
         return len(rows)
 
+    def _executemany_batches(
+        self,
+        cursor: pyodbc.Cursor,
+        statement: str,
+        rows: Sequence[tuple[object, ...]],
+    ) -> None:
+        for start in range(0, len(rows), self.batch_size):
+            cursor.executemany(statement, rows[start : start + self.batch_size])
+
+    @contextmanager
+    def _connection(self) -> Iterator[pyodbc.Connection]:
+        if self._session_connection is not None:
+            yield self._session_connection
+            return
+        connection = self._connect()
+        try:
+            yield connection
+        finally:
+            connection.close()
+
     def _connect(self) -> pyodbc.Connection:
         return pyodbc.connect(self.settings.sqlserver_connection_string)
 
     @property
     @abstractmethod
-    def insert_statement(self) -> str:
-        """Return the INSERT statement used for bulk writes."""
+    def columns(self) -> tuple[str, ...]:
+        """Return the upsert column names in parameter order, merge key first."""
         raise NotImplementedError
 
+    @cached_property
+    def insert_statement(self) -> str:
+        """Return the single-statement MERGE used for row-by-row writes."""
+        return (
+            f"MERGE {self.table_name} AS target "
+            f"USING (VALUES ({self._placeholders})) AS source ({', '.join(self.columns)}) "
+            f"{self._merge_actions}"
+        )
+
+    @cached_property
+    def staging_table(self) -> str:
+        return f"#{self.table_name.rsplit('.', 1)[-1]}_staging"
+
+    @cached_property
+    def staging_statement(self) -> str:
+        selected = ", ".join(
+            f"{_TARGET_COLUMNS[column]} AS {column}" if column in _TARGET_COLUMNS else column
+            for column in self.columns
+        )
+        return (
+            f"DROP TABLE IF EXISTS {self.staging_table}; "
+            f"SELECT TOP 0 {selected} INTO {self.staging_table} FROM {self.table_name};"
+        )
+
+    @cached_property
+    def staging_insert_statement(self) -> str:
+        return f"INSERT INTO {self.staging_table} VALUES ({self._placeholders})"
+
+    @cached_property
+    def merge_statement(self) -> str:
+        return (
+            f"MERGE {self.table_name} AS target "
+            f"USING {self.staging_table} AS source "
+            f"{self._merge_actions}"
+        )
+
+    @cached_property
+    def _placeholders(self) -> str:
+        return ", ".join("?" * len(self.columns))
+
+    @cached_property
+    def _merge_actions(self) -> str:
+        key = self.columns[0]
+        targets = [_TARGET_COLUMNS.get(column, column) for column in self.columns]
+        updates = ", ".join(
+            f"{target} = source.{column}"
+            for column, target in zip(self.columns[1:], targets[1:])
+            if column != "add_time"
+        )
+        sources = ", ".join(f"source.{column}" for column in self.columns)
+        return (
+            f"ON target.{key} = source.{key} "
+            f"WHEN MATCHED THEN UPDATE SET {updates} "
+            f"WHEN NOT MATCHED THEN INSERT ({', '.join(targets)}) VALUES ({sources});"
+        )
+
 
 __all__ = ["BaseSQLRepository", "DatabaseSaveError"]
@@ -0,0 +1,41 @@
+"""Request helpers shared by the Kalshi service classes."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Mapping, Sequence
+
+import orjson
+
+from kalshi_client import json_fast
+
+
+def build_params(
+    filters: Mapping[str, Any],
+    optional_keys: Sequence[str],
+    non_empty_keys: Sequence[str],
+) -> dict[str, Any]:
+    """Select request params from caller filters.
+
+    ``optional_keys`` are forwarded whenever they are not None; ``non_empty_keys``
+    only when truthy, so empty strings and lists are dropped.
+    """
+    params = {
+        key: value
+        for key in optional_keys
+        if (value := filters.get(key)) is not None
+    }
+    params.update((key, value) for key in non_empty_keys if (value := filters.get(key)))
+    return params
+
+
+def load_json_payload(response: Any, logger: logging.Logger, label: str) -> Any:
+    """Parse a raw SDK response body, returning {} when it is not valid JSON."""
+    try:
+        return json_fast(response)
+    except orjson.JSONDecodeError as exc:
+        # orjson reports the offending document already decoded to str.
+        logger.error("Unable to decode %s payload (%s): %s", label, exc.msg, exc.doc[:200])
+        return {}
+
+
+__all__ = ["build_params", "load_json_payload"]
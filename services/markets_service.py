@@ -1,14 +1,19 @@
 """Helpers for retrieving Kalshi markets with pagination support."""
 from __future__ import annotations
 
-import json
 import logging
+from datetime import datetime
 from typing import Any, Optional, Tuple
 
 from pydantic import ValidationError
 
 from kalshi_client import KalshiAPIClient
 from models.market_record import MarketRecord
+from services.base_service import build_params, load_json_payload
+
+
+_OPTIONAL_PARAMS = ("limit", "cursor", "max_close_ts", "min_close_ts")
+_NON_EMPTY_PARAMS = ("event_ticker", "series_ticker", "status", "tickers")
 
 
 class MarketsService:
@@ -21,7 +26,22 @@ class MarketsService:
         )
 
     def list_market_records(self, **filters: Any) -> Tuple[list[MarketRecord], Optional[str]]:
-        params = self._build_params(**filters)
+        markets, cursor = self._fetch_markets(
+            build_params(filters, _OPTIONAL_PARAMS, _NON_EMPTY_PARAMS)
+        )
+        records = [MarketRecord.from_api(market) for market in markets]
+        return records, cursor
+
+    def list_market_rows(self, **filters: Any) -> Tuple[list[tuple[Any, ...]], Optional[str]]:
+        """Return upsert-ready parameter rows, skipping MarketRecord construction."""
+        markets, cursor = self._fetch_markets(
+            build_params(filters, _OPTIONAL_PARAMS, _NON_EMPTY_PARAMS)
+        )
+        now = datetime.now()
+        rows = [MarketRecord.row_from_api(market, now) for market in markets]
+        return rows, cursor
+
+    def _fetch_markets(self, params: dict[str, Any]) -> Tuple[list[Any], Optional[str]]:
         try:
             response = self._client.call("get_markets", authenticated=True, **params)
             markets = getattr(response, "markets", None) or []
@@ -34,43 +54,13 @@ class MarketsService:
             payload = self._fetch_raw_markets(params)
             markets = payload.get("markets", []) if isinstance(payload, dict) else []
             cursor = payload.get("cursor") if isinstance(payload, dict) else None
-        records = [MarketRecord.from_api(market) for market in markets]
-        return records, cursor
-
-    def _build_params(self, **filters: Any) -> dict[str, Any]:
-        params: dict[str, Any] = {}
-        if (limit := filters.get("limit")) is not None:
-            params["limit"] = limit
-        if (cursor := filters.get("cursor")) is not None:
-            params["cursor"] = cursor
-        if (event_ticker := filters.get("event_ticker")):
-            params["event_ticker"] = event_ticker
-        if (series_ticker := filters.get("series_ticker")):
-            params["series_ticker"] = series_ticker
-        if (max_close_ts := filters.get("max_close_ts")) is not None:
-            params["max_close_ts"] = max_close_ts
-        if (min_close_ts := filters.get("min_close_ts")) is not None:
-            params["min_close_ts"] = min_close_ts
-        if (status := filters.get("status")):
-            params["status"] = status
-        if (tickers := filters.get("tickers")):
-            params["tickers"] = tickers
-        return params
+        return markets, cursor
 
     def _fetch_raw_markets(self, params: dict[str, Any]) -> dict[str, Any]:
         response = self._client.call(
             "get_markets_without_preload_content", authenticated=True, **params
         )
-        raw = getattr(response, "data", None)
-        if isinstance(raw, (bytes, bytearray)):
-            text = raw.decode("utf-8")
-        else:
-            text = str(raw or "")
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            self._logger.error("Unable to decode market payload: %s", text[:200])
-            return {}
+        return load_json_payload(response, self._logger, "market")
 
 
 __all__ = ["MarketsService", "MarketRecord"]